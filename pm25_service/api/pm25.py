@@ -1,19 +1,25 @@
+from typing import Literal
 from fastapi import APIRouter, Query, HTTPException
 from service.region_value import get_region_value
 from service.threshold import get_threshold
 
 router = APIRouter()
 
+Scenario = Literal["ssp126", "ssp245", "ssp370", "ssp585"]
+
 @router.get("/region")
-def region_value(region: str = Query(...), scenario: str = Query(...)):
-    value = get_region_value(region.upper(), scenario.lower())
+def region_value(
+    region: str = Query(..., min_length=2, max_length=2, pattern="^[A-Z]{2}$"),
+    scenario: Scenario = Query(...),
+):
+    value = get_region_value(region, scenario)
     if value is None:
         raise HTTPException(status_code=404, detail="Region or scenario not found")
     return {"value": value}
 
 @router.get("/threshold")
-def threshold(scenario: str = Query(...)):
-    value = get_threshold(scenario.lower())
+def threshold(scenario: Scenario = Query(...)):
+    value = get_threshold(scenario)
     if value is None:
         raise HTTPException(status_code=404, detail="Scenario not found")
     return {"value": value}
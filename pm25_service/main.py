@@ -1,9 +1,18 @@
 from fastapi import FastAPI
 from api import pm25
 from api.endpoints import indexer
+from service.region_value import load_region_values
+from service.threshold import load_thresholds
 
 
 app = FastAPI(title="PM2.5 AII Service")
 
+
+@app.on_event("startup")
+def load_lookup_tables():
+    # CSVs einmal beim Start in Dicts laden, Endpoints lesen nur noch aus RAM
+    load_region_values()
+    load_thresholds()
+
 app.include_router(pm25.router, prefix="/api/pm25", tags=["PM2.5"])
 app.include_router(indexer.router, prefix="/api/pm25", tags=["admin"])
@@ -1,33 +1,56 @@
 import boto3
-import os
-import re
 import json
+from functools import lru_cache
 
-def index_pm25_data(bucket_name, prefix="", minio_endpoint=None, access_key=None, secret_key=None):
-    s3 = boto3.client(
+
+# Client einmal bauen und wiederverwenden, damit der urllib3-Pool
+# (Keep-Alive-Sockets) ueber Requests hinweg warm bleibt
+@lru_cache(maxsize=1)
+def _s3_client(minio_endpoint=None, access_key=None, secret_key=None):
+    return boto3.client(
         "s3",
         endpoint_url=minio_endpoint,
         aws_access_key_id=access_key,
         aws_secret_access_key=secret_key,
     )
-    response = s3.list_objects_v2(Bucket=bucket_name, Prefix=prefix)
-    files = response.get('Contents', [])
+
+
+# CMIP-Namensschema: <var>_<freq>_<model>_<scenario>_<run>_<grid>_<JJJJMM>-<JJJJMM>.nc
+# Format ist strikt, daher reicht ein split('_') statt Regex pro Key
+def _parse_key(key):
+    name = key.rsplit('/', 1)[-1]
+    if not name.endswith('.nc'):
+        return None
+    parts = name[:-3].split('_')
+    if len(parts) != 7:
+        return None
+    var, freq, model, scenario, run, grid, span = parts
+    start, sep, end = span.partition('-')
+    if not sep or len(start) != 6 or len(end) != 6 or not (start.isdigit() and end.isdigit()):
+        return None
+    return {
+        "var": var,
+        "freq": freq,
+        "model": model,
+        "scenario": scenario,
+        "run": run,
+        "grid": grid,
+        "start": start,
+        "end": end,
+    }
+
+
+def index_pm25_data(bucket_name, prefix="", minio_endpoint=None, access_key=None, secret_key=None):
+    s3 = _s3_client(minio_endpoint, access_key, secret_key)
+    # Paginator statt einzelnem list_objects_v2-Call (max. 1000 Keys pro Seite)
+    paginator = s3.get_paginator("list_objects_v2")
     index = []
-    # REGEX pattern wie oben
-    pattern = (
-        r"(?P<var>[^_]+)_"
-        r"(?P<freq>[^_]+)_"
-        r"(?P<model>[^_]+)_"
-        r"(?P<scenario>[^_]+)_"
-        r"(?P<run>[^_]+)_"
-        r"(?P<grid>[^_]+)_"
-        r"(?P<start>\d{6})-(?P<end>\d{6})\.nc"
-    )
-    for f in files:
-        filename = f['Key']
-        m = re.match(pattern, os.path.basename(filename))
-        if m:
-            entry = m.groupdict()
-            entry['file'] = filename
-            index.append(entry)
+    # Seiten direkt beim Eintreffen parsen statt erst alle Contents zu sammeln
+    for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix):
+        for f in page.get('Contents', []):
+            filename = f['Key']
+            entry = _parse_key(filename)
+            if entry:
+                entry['file'] = filename
+                index.append(entry)
     return index
@@ -1,9 +1,15 @@
 import csv
 
-def get_region_value(region: str, scenario: str):
+_TABLE = None
+
+def load_region_values():
+    global _TABLE
     with open("data/pm25_region_values.csv", newline="") as csvfile:
         reader = csv.DictReader(csvfile)
-        for row in reader:
-            if row["region"] == region and row["scenario"] == scenario:
-                return float(row["value"])
-    return None
+        _TABLE = {(row["region"], row["scenario"]): float(row["value"]) for row in reader}
+    return _TABLE
+
+def get_region_value(region: str, scenario: str):
+    if _TABLE is None:
+        load_region_values()
+    return _TABLE.get((region, scenario))
@@ -1,9 +1,19 @@
 import csv
+import os
+
+_PATH = "data/pm25_thresholds.csv"
+_TABLE = None
+_MTIME = 0.0
+
+def load_thresholds():
+    global _TABLE, _MTIME
+    mtime = os.path.getmtime(_PATH)
+    if _TABLE is None or mtime != _MTIME:
+        with open(_PATH, newline="") as csvfile:
+            reader = csv.DictReader(csvfile)
+            _TABLE = {row["scenario"]: float(row["threshold"]) for row in reader}
+        _MTIME = mtime
+    return _TABLE
 
 def get_threshold(scenario: str):
-    with open("data/pm25_thresholds.csv", newline="") as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            if row["scenario"] == scenario:
-                return float(row["threshold"])
-    return None
+    return load_thresholds().get(scenario)